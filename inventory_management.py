@@ -1,70 +1,172 @@
+import atexit
+import csv
+import json
 import os
+import signal
 
-filename= "stock.txt"
+filename= "stock.json"
+legacy_filename= "stock.txt"
+legacy_migrated_filename= "stock.txt.migrated"
+legacy_pending= False
+unsaved_changes= False
 
 def get_integer_input(prompt):
     while True:
+        value= input(prompt).strip()
+        # Plain digits, the common case, are converted without a try/except;
+        # other forms int() accepts, such as "+5" or "1_000", fall through.
+        if value.isdecimal():
+            return int(value)
         try:
-            value= int(input(prompt))
-            if value < 0:
-                print("Please enter a non-negative integer.")
-                continue
-            return value
+            number= int(value)
         except ValueError:
             print("Invalid input. Please enter an integer value.")
+            continue
+        if number < 0:
+            print("Please enter a non-negative integer.")
+            continue
+        return number
 
 def load_inventory():
-    inventory = {}
     if not os.path.exists(filename):
-        return inventory
+        return load_legacy_inventory()
     try:
         with open(filename, 'r') as file:
+            inventory = json.load(file)
+        if not is_valid_inventory(inventory):
+            raise ValueError("expected product names mapped to non-negative integers")
+        return inventory
+    except Exception as e:
+        print(f"Error loading inventory: {e}")
+    # Move the unreadable file aside so the next save cannot overwrite the stock in it.
+    backup_filename = next_backup_filename()
+    try:
+        os.replace(filename, backup_filename)
+    except Exception as e:
+        print(f"Error moving '{filename}' to '{backup_filename}': {e}")
+        raise SystemExit(f"Refusing to start: '{filename}' could not be read or moved aside.")
+    print(f"The stock file was moved to '{backup_filename}'. Starting with an empty inventory.")
+    return {}
+def next_backup_filename():
+    # Never reuse an existing backup name, so earlier backups are kept.
+    backup_filename = filename + ".bak"
+    counter = 1
+    while os.path.exists(backup_filename):
+        backup_filename = f"{filename}.bak{counter}"
+        counter += 1
+    return backup_filename
+def is_valid_inventory(inventory):
+    return isinstance(inventory, dict) and all(
+        type(quantity) is int and quantity >= 0 for quantity in inventory.values())
+def load_legacy_inventory():
+    # Read the old tab-separated stock file once. It is converted to JSON by the
+    # next successful save and then renamed, so it cannot be loaded again.
+    global legacy_pending
+    if not os.path.exists(legacy_filename):
+        return {}
+    inventory = {}
+    try:
+        with open(legacy_filename, 'r') as file:
             for line in file:
                 product, quantity = line.strip().split('\t')
                 inventory[product] = int(quantity)
+        if not is_valid_inventory(inventory):
+            raise ValueError("expected non-negative quantities")
     except Exception as e:
         print(f"Error loading inventory: {e}")
+        print(f"'{legacy_filename}' was left unchanged and not converted. Starting with an empty inventory.")
+        return {}
+    if inventory:
+        legacy_pending = True
+        mark_changed()
     return inventory
+def finish_legacy_migration():
+    global legacy_pending
+    try:
+        os.replace(legacy_filename, legacy_migrated_filename)
+        legacy_pending = False
+    except Exception as e:
+        print(f"Error renaming '{legacy_filename}' after conversion: {e}")
 def save_inventory(inventory):
+    # Write to a temporary file, flush it to disk and swap it in, so the stock
+    # file is always either the old version or the complete new one.
+    temp_filename = filename + ".tmp"
     try:
-        with open(filename, 'w') as file:
-            for product, quantity in inventory.items():
-                file.write(f"{product}\t{quantity}\n")
+        with open(temp_filename, 'w') as file:
+            json.dump(inventory, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_filename, filename)
     except Exception as e:
         print(f"Error saving inventory: {e}")
+        if os.path.isfile(temp_filename):
+            os.remove(temp_filename)
+        return False
+    if legacy_pending:
+        finish_legacy_migration()
+    return True
+def mark_changed():
+    global unsaved_changes
+    unsaved_changes = True
+def save_changes(inventory):
+    # Mutators only mark the inventory as changed; the file is rewritten
+    # here, on exit, instead of after every single edit.
+    # Returns False if the save failed; the changes stay marked as unsaved.
+    global unsaved_changes
+    if unsaved_changes:
+        if not save_inventory(inventory):
+            return False
+        unsaved_changes = False
+    return True
+def exit_on_signal(signum, frame):
+    # Turn SIGTERM/SIGHUP into a normal exit so the atexit save still runs.
+    raise SystemExit(128 + signum)
 def add_product(inventory):
     print("Adding product to inventory...")
-    product_name= input("Enter product name: ")
+    product_name= input("Enter product name: ").strip()
+    if not product_name:
+        print("Product name cannot be empty.")
+        return
     quantity= get_integer_input("Enter quantity: ")
-    if product_name in inventory:
-        inventory[product_name] += quantity
-    else:
-        inventory[product_name] = quantity
-    save_inventory(inventory)
+    inventory[product_name] = inventory.get(product_name, 0) + quantity
+    mark_changed()
     print(f"Product '{product_name}' added/updated successfully.")
+def add_products(inventory, rows):
+    # Merge many (product, quantity) pairs in one pass, e.g. from an import.
+    # Pairs without a product name or a non-negative integer quantity are
+    # skipped, so the saved file always passes is_valid_inventory.
+    merged = 0
+    for product_name, quantity in rows:
+        if not (isinstance(product_name, str) and product_name and type(quantity) is int and quantity >= 0):
+            continue
+        inventory[product_name] = inventory.get(product_name, 0) + quantity
+        merged += 1
+    if merged:
+        mark_changed()
+    return merged
 def add_quantity(inventory):
     print("Adding quantity to existing product...")
-    product_name= input("Enter product name: ")
+    product_name= input("Enter product name: ").strip()
     if product_name in inventory:
         quantity= get_integer_input("Enter quantity to add: ")
         inventory[product_name] += quantity
-        save_inventory(inventory)
+        mark_changed()
         print(f"Quantity updated successfully for '{product_name}'.")
     else:
         print(f"Product '{product_name}' not found in inventory.")
 def update_quantity(inventory):
     print("Updating quantity of existing product...")
-    product_name= input("Enter product name: ")
+    product_name= input("Enter product name: ").strip()
     if product_name in inventory:
         quantity= get_integer_input("Enter new quantity: ")
         inventory[product_name] = quantity
-        save_inventory(inventory)
+        mark_changed()
         print(f"Quantity updated successfully for '{product_name}'.")
     else:
         print(f"Product '{product_name}' not found in inventory.")
 def delete_quantity(inventory):
     print("Deleting quantity from existing product...")
-    product_name= input("Enter product name: ")
+    product_name= input("Enter product name: ").strip()
     if product_name in inventory:
         quantity= get_integer_input("Enter quantity to delete: ")
         if quantity >= inventory[product_name]:
@@ -73,12 +175,12 @@ def delete_quantity(inventory):
         else:
             inventory[product_name] -= quantity
             print(f"Quantity updated successfully for '{product_name}'.")
-        save_inventory(inventory)
+        mark_changed()
     else:
         print(f"Product '{product_name}' not found in inventory.")
 def order_product(inventory):
     print("Ordering product...")
-    product_name= input("Enter product name: ")
+    product_name= input("Enter product name: ").strip()
     if product_name in inventory:
         quantity= get_integer_input("Enter quantity to order: ")
         if quantity <= 0:
@@ -86,7 +188,7 @@ def order_product(inventory):
             return
         if quantity <= inventory[product_name]:
             inventory[product_name] -= quantity
-            save_inventory(inventory)
+            mark_changed()
             print(f"Order placed successfully for '{product_name}'.")
         else:
             print(f"Insufficient stock for '{product_name}'. Available quantity: {inventory[product_name]}")
@@ -98,36 +200,68 @@ def display_inventory(inventory):
         print("Inventory is empty.")
         return
     else:
-        for product, quantity in sorted(inventory.items()):
-            print(f"Product: {product}, Quantity: {quantity}")
+        print("\n".join(f"Product: {product}, Quantity: {quantity}" for product, quantity in sorted(inventory.items())))
+def bulk_load_products(inventory):
+    print("Loading products from CSV file...")
+    path= input("Enter CSV file path: ")
+    rows = []
+    skipped = 0
+    try:
+        with open(path, 'r', newline='') as file:
+            for row in csv.reader(file):
+                if not row:
+                    continue
+                if len(row) == 2 and row[0].strip() and row[1].strip().isdecimal():
+                    rows.append((row[0].strip(), int(row[1])))
+                else:
+                    skipped += 1
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        return
+    if not rows:
+        print(f"No valid product rows found in '{path}'. Skipped {skipped} invalid rows.")
+        return
+    add_products(inventory, rows)
+    print(f"Loaded {len(rows)} product rows from '{path}'. Skipped {skipped} invalid rows.")
+menu_actions = {
+    '1': add_product,
+    '2': add_quantity,
+    '3': update_quantity,
+    '4': delete_quantity,
+    '5': order_product,
+    '6': display_inventory,
+    '8': bulk_load_products,
+}
+menu_text = "\n".join([
+    "\nInventory Management System",
+    "1. Add Product",
+    "2. Add Quantity to Existing Product",
+    "3. Update Quantity of Existing Product",
+    "4. Delete Quantity from Existing Product",
+    "5. Order Product",
+    "6. Display Inventory",
+    "7. Exit",
+    "8. Bulk Load Products from CSV",
+])
 def main():
     inventory = load_inventory()
+    atexit.register(save_changes, inventory)
+    for name in ("SIGTERM", "SIGHUP"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), exit_on_signal)
     while True:
-        print("\nInventory Management System")
-        print("1. Add Product")
-        print("2. Add Quantity to Existing Product")
-        print("3. Update Quantity of Existing Product")
-        print("4. Delete Quantity from Existing Product")
-        print("5. Order Product")
-        print("6. Display Inventory")
-        print("7. Exit")
-        choice = input("Enter your choice (1-7): ")
-        if choice == '1':
-            add_product(inventory)
-        elif choice == '2':
-            add_quantity(inventory)
-        elif choice == '3':
-            update_quantity(inventory)
-        elif choice == '4':
-            delete_quantity(inventory)
-        elif choice == '5':
-            order_product(inventory)
-        elif choice == '6':
-            display_inventory(inventory)
+        print(menu_text)
+        choice = input("Enter your choice (1-8): ")
+        action = menu_actions.get(choice)
+        if action:
+            action(inventory)
         elif choice == '7':
+            if not save_changes(inventory):
+                print("Changes were not saved. Fix the problem above and choose Exit again.")
+                continue
             print("Exiting Inventory Management System.")
             break
         else:
-            print("Invalid choice. Please enter a number between 1 and 7.")
+            print("Invalid choice. Please enter a number between 1 and 8.")
 if __name__ == "__main__":
     main()
\ No newline at end of file